@@ -19,16 +19,22 @@ VivaTechnology multi‑sector scraper
 """
 from __future__ import annotations
 
+import asyncio
 import csv
+import contextlib
+import functools
 import re
 import time
 import warnings
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, TextIO
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import html as lxml_html
 from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -52,23 +58,110 @@ LIST_URLS = [
     "https://vivatechnology.com/partners?sectors=mobility%252Ftransportation%257Csmart%2520city%252Fbuilding",
 ]
 
+OUTPUT_CSV = Path("viva_partners.csv")
 HEADLESS = True
 SCROLL_STEP = 800
-SCROLL_PAUSE = 0.8
+SCROLL_POLL = 0.1
+NEW_CARDS_TIMEOUT = 2.0
 MAX_SCROLL_LOOPS = 600
-STABLE_THRESHOLD = 4
-REQUEST_PAUSE = 0.4
+STABLE_THRESHOLD = 2
+MAX_CONNECTIONS = 20
+HTTP_TIMEOUT = 15.0
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "en",
+}
 MAX_RETRIES = 3
+# HTTP statuses worth retrying; any other 4xx is permanent
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_EVERY = 10
+CSV_FIELDS = ["name", "booth", "homepage", "categories", "overview", "partner_url"]
+
+# Scrolls a sector page until the partner list stops growing, entirely inside the
+# browser: one execute_async_script call instead of several round-trips per step.
+# Each round scrolls the last partner card into view (which fires the lazy-load
+# observer) and polls until new cards appear or the timeout expires; after a
+# round without new cards it nudges the page down by a fixed step instead.
+# Arguments: step (px), timeout (ms), poll (ms), max loops, stable threshold, callback.
+SCROLL_SCRIPT = """
+const [step, timeout, poll, maxLoops, stableThreshold, done] = arguments;
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const cards = () => document.querySelectorAll('a[href^="/partners/"]');
+const partnerCount = () => new Set(Array.from(cards(), (a) => a.href.split("?")[0])).size;
+const waitForGrowth = async (previous) => {
+    const deadline = Date.now() + timeout;
+    let count = partnerCount();
+    while (count <= previous && Date.now() < deadline) {
+        await sleep(poll);
+        count = partnerCount();
+    }
+    return count;
+};
+(async () => {
+    let lastCount = partnerCount();
+    let stableRounds = 0;
+    for (let i = 0; i < maxLoops; i++) {
+        const all = cards();
+        if (all.length && stableRounds === 0) {
+            all[all.length - 1].scrollIntoView({block: "end"});
+        } else {
+            window.scrollBy(0, step);
+        }
+        const count = await waitForGrowth(lastCount);
+        if (count === lastCount) {
+            stableRounds += 1;
+            if (stableRounds >= stableThreshold) break;
+        } else {
+            stableRounds = 0;
+            lastCount = count;
+        }
+        const atBottom = window.innerHeight + window.scrollY >= document.body.scrollHeight - 2;
+        if (atBottom && stableRounds >= 1) break;
+    }
+    done();
+})();
+"""
+
+# resources the listing pages never need – blocked at the network layer
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.ttf", "*.mp4", "*.webm",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*intercom*", "*facebook*",
+]
 
 # domains to exclude
 SOCIAL_RE = re.compile(
     r"linkedin|youtube|instagram|facebook|twitter|cookiebot|cookieyes|airtable|intercom", re.I
 )
+# SOCIAL_RE plus site-internal and legal links – filter for a plain homepage link
+EXCLUDE_RE = re.compile(SOCIAL_RE.pattern + r"|privacy|cookie|vivatechnology\.com", re.I)
+
+# class sets of the partner page fields (matched as subsets of a tag's classes)
+BOOTH_CLASSES = frozenset({"ml-1", "uppercase"})
+CATEGORY_CLASSES = frozenset({"flex-1", "font-normal", "text-clr-default-400", "text-xs", "px-2", "truncate"})
+OVERVIEW_CLASSES = frozenset({"my-4", "text-xs", "leading-relaxed"})
+
+# bs4 applies parse_only to top-level elements only: anything outside the first
+# kept a/span/div/h1 (<head>, body-level <script>/<style>/<nav>) is never built,
+# but everything nested inside a kept element – scripts included – still is.
+# Matching is by tag name only – the booth selectors depend on parent/sibling
+# context, so filtering by class here would drop the nodes they need.
+PARTNER_STRAINER = SoupStrainer(["a", "span", "div", "h1"])
 
 # ---------------------------------------------------------------------------
 # Selenium helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _driver_path() -> str:
+    # resolved once per process; later drivers reuse the downloaded binary
+    return ChromeDriverManager().install()
+
+
 def _make_driver(headless: bool = True) -> webdriver.Chrome:
     opts = Options()
     if headless:
@@ -77,51 +170,58 @@ def _make_driver(headless: bool = True) -> webdriver.Chrome:
     opts.add_argument("--disable-gpu")
     opts.add_argument("--window-size=1920,1080")
     opts.add_argument("--lang=en")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=opts)
+    # return from get() once the DOM is interactive instead of waiting on window.onload
+    opts.page_load_strategy = "eager"
+    opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    service = Service(_driver_path())
+    driver = webdriver.Chrome(service=service, options=opts)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
 
 # ---------------------------------------------------------------------------
 # Collect partner URLs from all sector pages
 # ---------------------------------------------------------------------------
 
 def _current_partner_links(driver: webdriver.Chrome) -> Set[str]:
+    # one page_source round-trip, then XPath in-process instead of get_attribute per anchor
+    tree = lxml_html.fromstring(driver.page_source)
     return {
-        a.get_attribute("href").split("?")[0]
-        for a in driver.find_elements(By.CSS_SELECTOR, 'a[href^="/partners/"]')
-        if a.get_attribute("href")
+        urljoin(BASE_URL, href.split("?")[0])
+        for href in tree.xpath('//a[starts-with(@href, "/partners/")]/@href')
     }
 
-def collect_all_partner_urls() -> List[str]:
+def collect_all_partner_urls(driver: webdriver.Chrome, list_urls: List[str] = LIST_URLS) -> List[str]:
     all_links: Set[str] = set()
-    for page_url in LIST_URLS:
+    # the whole scroll loop runs as one async script – budget its worst case
+    # (every round waits the full timeout plus one poll of overshoot) and a margin
+    driver.set_script_timeout(MAX_SCROLL_LOOPS * (NEW_CARDS_TIMEOUT + SCROLL_POLL) + 60)
+    for page_url in list_urls:
         print(f"Scanning sector page → {page_url}")
-        driver = _make_driver(HEADLESS)
         driver.get(page_url)
-
-        last_count = -1
-        stable_rounds = 0
-        for _ in range(MAX_SCROLL_LOOPS):
-            driver.execute_script(f"window.scrollBy(0, {SCROLL_STEP});")
-            time.sleep(SCROLL_PAUSE)
-
-            links = _current_partner_links(driver)
-            if len(links) == last_count:
-                stable_rounds += 1
-                if stable_rounds >= STABLE_THRESHOLD:
-                    break
-            else:
-                stable_rounds = 0
-                last_count = len(links)
-
-            at_bottom = driver.execute_script(
-                "return (window.innerHeight + window.scrollY) >= document.body.scrollHeight - 2"
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href^="/partners/"]'))
             )
-            if at_bottom and stable_rounds >= 1:
-                break
+        except TimeoutException:
+            warnings.warn(f"{page_url} → no partner cards rendered, skipping")
+            continue
+        try:
+            driver.execute_async_script(
+                SCROLL_SCRIPT,
+                SCROLL_STEP,
+                int(NEW_CARDS_TIMEOUT * 1000),
+                int(SCROLL_POLL * 1000),
+                MAX_SCROLL_LOOPS,
+                STABLE_THRESHOLD,
+            )
+        except (TimeoutException, JavascriptException) as exc:
+            # keep whatever the page loaded so far
+            warnings.warn(f"{page_url} → scroll aborted: {exc}")
 
+        links = _current_partner_links(driver)
         print(f"  found {len(links)} links on this page")
         all_links.update(links)
-        driver.quit()
     print(f"Total unique partner profiles collected: {len(all_links)}")
     return sorted(all_links)
 
@@ -129,106 +229,287 @@ def collect_all_partner_urls() -> List[str]:
 # Fetch & parse partner page
 # ---------------------------------------------------------------------------
 
-def _fetch_html(url: str) -> str:
+async def _fetch_html(client: httpx.AsyncClient, sem: asyncio.Semaphore, url: str) -> str:
+    """GET the HTML of a partner profile.
+
+    Transport errors and ``RETRY_STATUSES`` are retried; other HTTP errors are
+    raised at once. *sem* is held only for the request itself, not the back-off.
+    The static HTML may lack client-rendered fields – see ``_fetch_rendered_html``.
+    """
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            d = _make_driver(HEADLESS)
-            d.get(url)
-            WebDriverWait(d, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "span.ml-1.uppercase"))
-            )
-            html = d.page_source
-            d.quit()
-            return html
-        except WebDriverException as exc:
-            warnings.warn(f"{url} → {exc} – retry {attempt}/{MAX_RETRIES}")
-            time.sleep(2 * attempt)
-    raise RuntimeError(f"Failed to fetch {url}")
-
-# ---------------------------------------------------------------------------
-# Field extractors (unchanged from previous version)
-# ---------------------------------------------------------------------------
-
-def _first_homepage(soup: BeautifulSoup) -> str:
-    for a in soup.select("a[href]"):
-        if a.find("span", class_="label symbols") and "language" in a.get_text(" ", strip=True).lower():
-            href = a["href"].strip()
-            if href.startswith("http") and not SOCIAL_RE.search(href):
-                return href
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if (
-            href.startswith("http")
-            and "vivatechnology.com" not in href
-            and not SOCIAL_RE.search(href)
-            and "privacy" not in href.lower()
-            and "cookie" not in href.lower()
-        ):
-            return href
-    return ""
-
-
-def _extract_booth(soup: BeautifulSoup) -> str:
-    for sel in [
-        "div.text-xs span.ml-1.uppercase",
-        "span.symbols + span.ml-1.uppercase",
-        "span.ml-1.uppercase",
-    ]:
-        tag = soup.select_one(sel)
-        if tag and tag.get_text(strip=True):
-            return tag.get_text(strip=True).strip('"“”')
-    return ""
-
-
-def _extract_categories(soup: BeautifulSoup) -> str:
-    cats = [span.get_text(strip=True) for span in soup.select(
-        "span.flex-1.font-normal.text-clr-default-400.text-xs.px-2.truncate")]
-    seen = set()
-    return ", ".join([c for c in cats if not (c in seen or seen.add(c))])
+            async with sem:
+                resp = await client.get(url)
+            resp.raise_for_status()
+            return resp.text
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in RETRY_STATUSES:
+                raise
+            error: httpx.HTTPError = exc
+        except httpx.TransportError as exc:
+            error = exc
+        if attempt < MAX_RETRIES:
+            warnings.warn(f"{url} → {error} – retry {attempt}/{MAX_RETRIES - 1}")
+            await asyncio.sleep(2 * attempt)
+    raise RuntimeError(f"Failed to fetch {url} → {error}")
+
+
+def _fetch_rendered_html(driver: webdriver.Chrome, url: str) -> str:
+    """Load *url* in *driver* and return the HTML once the booth span has rendered."""
+    driver.get(url)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "span.ml-1.uppercase"))
+    )
+    return driver.page_source
 
+# ---------------------------------------------------------------------------
+# Field extractor
+# ---------------------------------------------------------------------------
 
-def _extract_overview(soup: BeautifulSoup) -> str:
-    parts = [div.get_text(" ", strip=True) for div in soup.select("div.my-4.text-xs.leading-relaxed")]
-    return "\n".join(parts)
+def extract_all(soup: BeautifulSoup) -> Dict[str, str]:
+    """Collect every partner field in a single walk over *soup*.
+
+    The booth keeps the precedence of the former selector list:
+    ``div.text-xs span.ml-1.uppercase``, then ``span.symbols + span.ml-1.uppercase``,
+    then any ``span.ml-1.uppercase``. A language-flagged link wins as homepage
+    over the first plain external link.
+
+    Raises ValueError when the page has no ``<h1>`` or no ``span.ml-1.uppercase``:
+    the profile was not rendered in this HTML, and its row would be empty.
+    """
+    h1: Optional[Tag] = None
+    booth_tags: List[Optional[Tag]] = [None, None, None]
+    lang_href = ""
+    other_href = ""
+    cats: List[str] = []
+    overview: List[str] = []
+
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        classes = set(tag.get("class") or ())
+
+        if tag.name == "h1":
+            if h1 is None:
+                h1 = tag
+
+        elif tag.name == "span":
+            if BOOTH_CLASSES <= classes:
+                if booth_tags[0] is None and tag.find_parent("div", class_="text-xs"):
+                    booth_tags[0] = tag
+                if booth_tags[1] is None:
+                    prev = tag.find_previous_sibling()
+                    if prev is not None and prev.name == "span" and "symbols" in (prev.get("class") or ()):
+                        booth_tags[1] = tag
+                if booth_tags[2] is None:
+                    booth_tags[2] = tag
+            if CATEGORY_CLASSES <= classes:
+                cats.append(tag.get_text(strip=True))
+
+        elif tag.name == "div":
+            if OVERVIEW_CLASSES <= classes:
+                overview.append(tag.get_text(" ", strip=True))
+
+        elif tag.name == "a" and not lang_href and tag.has_attr("href"):
+            # a language-flagged link settles the homepage; until then test the
+            # cheap href checks first and only inspect the anchor's subtree after
+            href = tag["href"].strip()
+            if not href.startswith("http") or SOCIAL_RE.search(href):
+                continue
+            if tag.find("span", class_="label symbols") and "language" in tag.get_text(" ", strip=True).lower():
+                lang_href = href
+            elif not other_href and not EXCLUDE_RE.search(href):
+                other_href = href
+
+    if h1 is None or booth_tags[2] is None:
+        raise ValueError("partner fields missing from the HTML (h1 / span.ml-1.uppercase)")
+
+    booth = ""
+    for tag in booth_tags:
+        if tag is not None and tag.get_text(strip=True):
+            booth = tag.get_text(strip=True).strip('"“”')
+            break
+
+    seen = set()
+    return {
+        "name": h1.get_text(strip=True),
+        "booth": booth,
+        "homepage": lang_href or other_href,
+        "categories": ", ".join([c for c in cats if not (c in seen or seen.add(c))]),
+        "overview": "\n".join(overview),
+    }
 
 # ---------------------------------------------------------------------------
 # Parse one partner
 # ---------------------------------------------------------------------------
 
-def parse_partner(url: str) -> Dict[str, str]:
-    soup = BeautifulSoup(_fetch_html(url), "html.parser")
-    name = soup.find("h1").get_text(strip=True) if soup.find("h1") else url.rsplit("/", 1)[-1]
-    return {
-        "name": name,
-        "booth": _extract_booth(soup),
-        "homepage": _first_homepage(soup),
-        "categories": _extract_categories(soup),
-        "overview": _extract_overview(soup),
-        "partner_url": url,
-    }
+def parse_partner(url: str, html: str) -> Dict[str, str]:
+    soup = BeautifulSoup(html, "lxml", parse_only=PARTNER_STRAINER)
+    row = extract_all(soup)
+    row["partner_url"] = url
+    return row
 
 # ---------------------------------------------------------------------------
-# Main
+# Enrich partners concurrently
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    partner_urls = collect_all_partner_urls()
-    rows: List[Dict[str, str]] = []
-    for url in tqdm(partner_urls, desc="Scraping", unit="profile"):
-        try:
-            row = parse_partner(url)
-            rows.append(row)
-            print(f"{row['name']} -> {row['homepage']}")
-            time.sleep(REQUEST_PAUSE)
-        except Exception as exc:
-            warnings.warn(f"{url} failed → {exc}")
-
-    out = Path("viva_partners.csv")
-    with out.open("w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=["name", "booth", "homepage", "categories", "overview", "partner_url"])
+def _write_row(writer: csv.DictWriter, fp: TextIO, row: Dict[str, str], written: int) -> int:
+    """Write *row*, flushing every ``CSV_FLUSH_EVERY`` rows; returns the new count."""
+    writer.writerow(row)
+    written += 1
+    if written % CSV_FLUSH_EVERY == 0:
+        fp.flush()
+    print(f"{row['name']} -> {row['homepage']}")
+    return written
+
+
+async def _scrape_partner(
+    client: httpx.AsyncClient, sem: asyncio.Semaphore, url: str, needs_browser: List[str]
+) -> Optional[Dict[str, str]]:
+    try:
+        html = await _fetch_html(client, sem, url)
+        return parse_partner(url, html)
+    except ValueError:
+        # fields not in the static HTML – render this one in a browser later
+        needs_browser.append(url)
+    except Exception as exc:
+        warnings.warn(f"{url} failed → {exc}")
+    return None
+
+
+async def enrich_partners(partner_urls: List[str], writer: csv.DictWriter, fp: TextIO) -> List[str]:
+    """Scrape *partner_urls* over HTTP and stream each row to *writer* as it completes.
+
+    *fp* is flushed every ``CSV_FLUSH_EVERY`` rows so a crash mid-run keeps
+    what was scraped so far. Returns the URLs whose static HTML lacked the
+    partner fields, for ``scrape_with_browser``.
+    """
+    # the semaphore keeps queued requests from hitting httpx's pool timeout
+    sem = asyncio.Semaphore(MAX_CONNECTIONS)
+    needs_browser: List[str] = []
+    written = 0
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+        headers=HTTP_HEADERS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+    ) as client:
+        tasks = [_scrape_partner(client, sem, url, needs_browser) for url in partner_urls]
+        for coro in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping", unit="profile"):
+            row = await coro
+            if row is not None:
+                written = _write_row(writer, fp, row, written)
+    return needs_browser
+
+
+def scrape_with_browser(partner_urls: List[str], writer: csv.DictWriter, fp: TextIO) -> None:
+    """Render *partner_urls* one by one in a single shared Chrome driver.
+
+    Fallback for profiles whose fields are filled in client-side. Timeouts are
+    retried on the same session; any other WebDriverException replaces the
+    driver before the URL is retried.
+    """
+    written = 0
+    driver = _make_driver(HEADLESS)
+    try:
+        for url in tqdm(partner_urls, desc="Rendering", unit="profile"):
+            for attempt in range(1, MAX_RETRIES + 1):
+                try:
+                    html = _fetch_rendered_html(driver, url)
+                except TimeoutException as exc:
+                    error: Exception = exc
+                except WebDriverException as exc:
+                    # the session itself is broken – start a fresh browser
+                    error = exc
+                    with contextlib.suppress(WebDriverException):
+                        driver.quit()
+                    driver = _make_driver(HEADLESS)
+                else:
+                    try:
+                        written = _write_row(writer, fp, parse_partner(url, html), written)
+                    except ValueError as exc:
+                        warnings.warn(f"{url} failed → {exc}")
+                    break
+                if attempt < MAX_RETRIES:
+                    warnings.warn(f"{url} → {error} – retry {attempt}/{MAX_RETRIES - 1}")
+                    time.sleep(2 * attempt)
+            else:
+                warnings.warn(f"{url} failed → {error}")
+    finally:
+        with contextlib.suppress(WebDriverException):
+            driver.quit()
+
+# ---------------------------------------------------------------------------
+# Output file
+# ---------------------------------------------------------------------------
+
+def _sort_csv(path: Path) -> None:
+    """Rewrite *path* sorted by partner_url so re-runs give a stable file.
+
+    A URL written more than once keeps its last row – a fresh scrape is
+    appended after the cached row it replaces.
+    """
+    with path.open(newline="", encoding="utf-8") as fp:
+        latest = {row["partner_url"]: row for row in csv.DictReader(fp)}
+    rows = sorted(latest.values(), key=lambda row: row["partner_url"])
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as fp:
+        writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
         writer.writeheader()
         writer.writerows(rows)
+    # atomic swap – the streamed file stays intact if the rewrite fails
+    tmp.replace(path)
+
+# ---------------------------------------------------------------------------
+# Previous results
+# ---------------------------------------------------------------------------
+
+def _load_cached_rows(path: Path) -> Dict[str, Dict[str, str]]:
+    """Rows of a previous run keyed by partner_url (the last row wins)."""
+    if not path.exists():
+        return {}
+    with path.open(newline="", encoding="utf-8") as fp:
+        return {
+            row["partner_url"]: {field: row.get(field) or "" for field in CSV_FIELDS}
+            for row in csv.DictReader(fp)
+            if row.get("partner_url")
+        }
 
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(list_urls: List[str] = LIST_URLS, out: Path = OUTPUT_CSV) -> None:
+    """Scrape every partner listed on *list_urls* into the CSV at *out*."""
+    driver = _make_driver(HEADLESS)
+    try:
+        partner_urls = collect_all_partner_urls(driver, list_urls)
+    finally:
+        with contextlib.suppress(WebDriverException):
+            driver.quit()
+
+    # read before the file is truncated below
+    cached = _load_cached_rows(out)
+    # rows without a homepage are scraped again
+    todo = [url for url in partner_urls if not cached.get(url, {}).get("homepage")]
+    print(f"{len(cached)} cached profiles in {out.name}, scraping {len(todo)}")
+
+    with out.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as fp:
+        writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        # keep every cached row, listed this run or not, so neither a sector page
+        # that failed to render nor a failed re-fetch wipes a partner from the
+        # file; _sort_csv drops a cached row once a fresh one follows it
+        writer.writerows(cached.values())
+        fp.flush()
+        needs_browser = asyncio.run(enrich_partners(todo, writer, fp))
+        if needs_browser:
+            print(f"{len(needs_browser)} profiles lack fields in their static HTML – rendering in Chrome")
+            scrape_with_browser(needs_browser, writer, fp)
+
+    # rows were streamed in completion order; restore the stable URL order
+    _sort_csv(out)
     print(f"Scraping complete → {out.resolve()}")
 
 